@@ -6,7 +6,10 @@ questions, choices, instructors, learners, and submissions.
 """
 
 from django.contrib import admin
-from .models import Course, Lesson, Instructor, Learner, Question, Choice, Submission
+from .models import (
+    Course, Lesson, Instructor, Learner, Question, Choice, Submission, SubmissionChoice,
+    Enrollment
+)
 
 
 class LessonInline(admin.StackedInline):
@@ -21,6 +24,13 @@ class ChoiceInline(admin.StackedInline):
     extra = 2
 
 
+class SubmissionChoiceInline(admin.TabularInline):
+    """Inline admin for selected choices within submission admin."""
+    model = SubmissionChoice
+    extra = 1
+    autocomplete_fields = ['choice']
+
+
 class QuestionInline(admin.StackedInline):
     """Inline admin for questions within course admin."""
     model = Question
@@ -39,6 +49,13 @@ class QuestionAdmin(admin.ModelAdmin):
     """Admin configuration for Question model."""
     inlines = [ChoiceInline]
     list_display = ['content']
+    search_fields = ['content']
+
+
+class ChoiceAdmin(admin.ModelAdmin):
+    """Admin configuration for Choice model."""
+    autocomplete_fields = ['question']
+    search_fields = ['content']
 
 
 class LessonAdmin(admin.ModelAdmin):
@@ -46,11 +63,43 @@ class LessonAdmin(admin.ModelAdmin):
     list_display = ['title']
 
 
+class InstructorAdmin(admin.ModelAdmin):
+    """Admin configuration for Instructor model."""
+    list_select_related = ('user',)
+
+
+class LearnerAdmin(admin.ModelAdmin):
+    """Admin configuration for Learner model."""
+    list_select_related = ('user',)
+
+
+class EnrollmentAdmin(admin.ModelAdmin):
+    """Admin configuration for Enrollment model."""
+    list_select_related = ('user', 'course')
+    raw_id_fields = ('user', 'course')
+    search_fields = ['user__username', 'course__name']
+
+    def get_search_results(self, request, queryset, search_term):
+        """Join user and course for the submission autocomplete, which renders __str__."""
+        queryset, may_have_duplicates = super().get_search_results(
+            request, queryset, search_term
+        )
+        return queryset.select_related('user', 'course'), may_have_duplicates
+
+
+class SubmissionAdmin(admin.ModelAdmin):
+    """Admin configuration for Submission model."""
+    inlines = [SubmissionChoiceInline]
+    list_select_related = ('enrollment__user', 'enrollment__course')
+    autocomplete_fields = ['enrollment']
+
+
 # Register models with admin
 admin.site.register(Course, CourseAdmin)
 admin.site.register(Lesson, LessonAdmin)
-admin.site.register(Instructor)
-admin.site.register(Learner)
+admin.site.register(Instructor, InstructorAdmin)
+admin.site.register(Learner, LearnerAdmin)
+admin.site.register(Enrollment, EnrollmentAdmin)
 admin.site.register(Question, QuestionAdmin)
-admin.site.register(Choice)
-admin.site.register(Submission)
+admin.site.register(Choice, ChoiceAdmin)
+admin.site.register(Submission, SubmissionAdmin)
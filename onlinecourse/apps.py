@@ -10,3 +10,7 @@ from django.apps import AppConfig
 class OnlinecourseConfig(AppConfig):
     """Configuration for the onlinecourse Django app."""
     name = 'onlinecourse'
+
+    def ready(self):
+        """Connect the app's signal handlers."""
+        from . import signals  # pylint: disable=import-outside-toplevel,unused-import
@@ -0,0 +1,26 @@
+# Generated by Django 4.2.3 on 2026-10-15 21:59
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('onlinecourse', '0002_choice_submission_question_choice_question'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='course',
+            name='pub_date',
+            field=models.DateField(db_index=True, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='choice',
+            index=models.Index(fields=['question', 'is_correct'], name='onlinecours_questio_6b5ec1_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='enrollment',
+            index=models.Index(fields=['user', 'course'], name='onlinecours_user_id_2ad52a_idx'),
+        ),
+    ]
@@ -0,0 +1,37 @@
+# Generated by Django 4.2.3 on 2026-10-15 22:02
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('onlinecourse', '0004_choice_correct_idx'),
+    ]
+
+    # The table already exists as the implicit many-to-many table, with the
+    # same columns, unique constraint and indexes, so only the state changes.
+    operations = [
+        migrations.SeparateDatabaseAndState(
+            state_operations=[
+                migrations.CreateModel(
+                    name='SubmissionChoice',
+                    fields=[
+                        ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                        ('choice', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='onlinecourse.choice')),
+                        ('submission', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='onlinecourse.submission')),
+                    ],
+                    options={
+                        'db_table': 'onlinecourse_submission_choices',
+                        'unique_together': {('submission', 'choice')},
+                    },
+                ),
+                migrations.AlterField(
+                    model_name='submission',
+                    name='choices',
+                    field=models.ManyToManyField(through='onlinecourse.SubmissionChoice', to='onlinecourse.choice'),
+                ),
+            ],
+        ),
+    ]
@@ -17,6 +17,19 @@ except AttributeError as exc:
     raise ImportError("Django modules not available") from exc
 
 
+class UserRelatedManager(models.Manager):
+    """
+    Manager that always joins the user row.
+    
+    Used for models whose string representation reads the username, so
+    listing them does not issue a query per row.
+    """
+
+    def get_queryset(self):
+        """Return the default queryset with the user selected."""
+        return super().get_queryset().select_related('user')
+
+
 # Instructor model
 class Instructor(models.Model):
     """
@@ -34,6 +47,8 @@ class Instructor(models.Model):
     full_time = models.BooleanField(default=True)
     total_learners = models.IntegerField()
 
+    objects = UserRelatedManager()
+
     def __str__(self):
         """Return string representation of instructor."""
         return self.user.username
@@ -71,11 +86,18 @@ class Learner(models.Model):
     )
     social_link = models.URLField(max_length=200)
 
+    objects = UserRelatedManager()
+
     def __str__(self):
         """Return string representation of learner."""
         return f"{self.user.username},{self.occupation}"
 
 
+# Cache settings for the top courses shown on the course list page
+TOP_COURSES_CACHE_KEY = 'top_courses_v1'
+TOP_COURSES_CACHE_TIMEOUT = 300
+
+
 # Course model
 class Course(models.Model):
     """
@@ -94,7 +116,7 @@ class Course(models.Model):
     name = models.CharField(null=False, max_length=30, default='online course')
     image = models.ImageField(upload_to='course_images/')
     description = models.CharField(max_length=1000)
-    pub_date = models.DateField(null=True)
+    pub_date = models.DateField(null=True, db_index=True)
     instructors = models.ManyToManyField(Instructor)
     users = models.ManyToManyField(
         settings.AUTH_USER_MODEL,
@@ -159,6 +181,12 @@ class Enrollment(models.Model):
     mode = models.CharField(max_length=5, choices=COURSE_MODES, default=AUDIT)
     rating = models.FloatField(default=5.0)
 
+    class Meta:
+        indexes = [
+            # Covers enrollment lookups by user and course
+            models.Index(fields=['user', 'course']),
+        ]
+
     def __str__(self):
         """Return string representation of enrollment."""
         return f"{self.user.username} enrolled in {self.course.name}"
@@ -189,14 +217,15 @@ class Question(models.Model):
             selected_ids: List of selected choice IDs
             
         Returns:
-            bool: True if learner selected all correct answers, False otherwise
+            bool: True if learner selected all correct answers and no incorrect
+            ones, False otherwise
         """
-        all_answers = self.choice_set.filter(is_correct=True).count()
-        selected_correct = self.choice_set.filter(
-            is_correct=True,
-            id__in=selected_ids
-        ).count()
-        return all_answers == selected_correct
+        selected = {int(choice_id) for choice_id in selected_ids}
+        # Uses the prefetched choices when the caller provides them
+        choices = self.choice_set.all()
+        correct_ids = {choice.id for choice in choices if choice.is_correct}
+        question_selected = selected & {choice.id for choice in choices}
+        return correct_ids == question_selected
 
 class Choice(models.Model):
     """
@@ -211,6 +240,18 @@ class Choice(models.Model):
     content = models.CharField(max_length=200)
     is_correct = models.BooleanField(default=False)
 
+    class Meta:
+        indexes = [
+            # Covers correct-answer lookups per question
+            models.Index(fields=['question', 'is_correct']),
+            # Partial index over correct answers only
+            models.Index(
+                fields=['question'],
+                condition=models.Q(is_correct=True),
+                name='choice_correct_idx'
+            ),
+        ]
+
     def __str__(self):
         """Return string representation of choice."""
         return f"{self.content} ({'Correct' if self.is_correct else 'Incorrect'})"
@@ -225,11 +266,34 @@ class Submission(models.Model):
     
     Attributes:
         enrollment: Foreign key to the Enrollment model
-        choices: Many-to-many relationship with Choice model
+        choices: Many-to-many relationship with Choice model through SubmissionChoice
     """
     enrollment = models.ForeignKey(Enrollment, on_delete=models.CASCADE)
-    choices = models.ManyToManyField(Choice)
+    choices = models.ManyToManyField(Choice, through='SubmissionChoice')
 
     def __str__(self):
         """Return string representation of submission."""
         return f"Submission by {self.enrollment.user.username} for {self.enrollment.course.name}"
+
+
+class SubmissionChoice(models.Model):
+    """
+    Model linking a submission to one of its selected choices.
+    
+    Uses the table previously created for the implicit many-to-many
+    relationship, which already indexes both foreign keys.
+    
+    Attributes:
+        submission: Foreign key to the Submission model
+        choice: Foreign key to the selected Choice
+    """
+    submission = models.ForeignKey(Submission, on_delete=models.CASCADE)
+    choice = models.ForeignKey(Choice, on_delete=models.CASCADE)
+
+    class Meta:
+        db_table = 'onlinecourse_submission_choices'
+        unique_together = ('submission', 'choice')
+
+    def __str__(self):
+        """Return string representation of submission choice."""
+        return f"Submission {self.submission_id}: choice {self.choice_id}"
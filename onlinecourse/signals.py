@@ -0,0 +1,19 @@
+"""
+Signal handlers for the online course application.
+
+This module keeps cached course data in sync with changes made outside the
+views, such as course edits in the admin.
+"""
+
+from django.core.cache import cache
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .models import TOP_COURSES_CACHE_KEY, Course
+
+
+@receiver(post_save, sender=Course)
+@receiver(post_delete, sender=Course)
+def clear_top_courses_cache(sender, **kwargs):  # pylint: disable=unused-argument
+    """Drop the cached top course list when a course is saved or deleted."""
+    cache.delete(TOP_COURSES_CACHE_KEY)
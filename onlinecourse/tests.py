@@ -1,3 +1,140 @@
+"""
+Tests for the online course application.
+
+This module covers the cached course list, exam submission, grading, and the
+exam result view.
+"""
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
 from django.test import TestCase
+from django.urls import reverse
+
+from .models import Choice, Course, Enrollment, Question, Submission
+
+
+class CourseListCacheTests(TestCase):
+    """Tests for the cached top course list and its enrollment flags."""
+
+    def setUp(self):
+        """Create two users and two courses, starting from an empty cache."""
+        cache.clear()
+        user_model = get_user_model()
+        self.alice = user_model.objects.create_user(username='alice', password='secret')
+        self.bob = user_model.objects.create_user(username='bob', password='secret')
+        self.course = Course.objects.create(name='Django', description='Intro', image='x.png')
+        self.other = Course.objects.create(name='Python', description='Basics', image='y.png')
+
+    def get_course_list(self):
+        """Render the index page and return its courses keyed by id."""
+        response = self.client.get(reverse('onlinecourse:index'))
+        return {course.id: course for course in response.context['course_list']}
+
+    def test_enroll_refreshes_cached_list(self):
+        """Enrolling clears the cache so the new enrollment count is shown."""
+        self.client.login(username='alice', password='secret')
+        self.assertEqual(self.get_course_list()[self.course.id].total_enrollment, 0)
+
+        self.client.post(reverse('onlinecourse:enroll', args=(self.course.id,)))
+
+        course = self.get_course_list()[self.course.id]
+        self.assertEqual(course.total_enrollment, 1)
+        self.assertTrue(course.is_enrolled)
+
+    def test_course_changes_refresh_cached_list(self):
+        """Saving or deleting a course clears the cached list."""
+        self.get_course_list()
+
+        self.course.name = 'Advanced Django'
+        self.course.save()
+        self.assertEqual(self.get_course_list()[self.course.id].name, 'Advanced Django')
+
+        self.other.delete()
+        self.assertNotIn(self.other.id, self.get_course_list())
+
+    def test_is_enrolled_is_computed_per_user(self):
+        """Enrollment flags do not leak between users through the cache."""
+        Enrollment.objects.create(user=self.alice, course=self.course)
+
+        self.client.login(username='alice', password='secret')
+        courses = self.get_course_list()
+        self.assertTrue(courses[self.course.id].is_enrolled)
+        self.assertFalse(courses[self.other.id].is_enrolled)
+
+        self.client.login(username='bob', password='secret')
+        self.assertFalse(self.get_course_list()[self.course.id].is_enrolled)
+
+        self.client.logout()
+        self.assertFalse(self.get_course_list()[self.course.id].is_enrolled)
+
+
+class ExamGradingTests(TestCase):
+    """Tests for submitting an exam and grading the result."""
+
+    def setUp(self):
+        """Create an enrolled user and a course with two questions."""
+        self.user = get_user_model().objects.create_user(username='learner', password='secret')
+        self.course = Course.objects.create(name='Django', description='Intro', image='x.png')
+        Enrollment.objects.create(user=self.user, course=self.course)
+        self.questions = [self.create_question(f'Question {i}') for i in range(2)]
+        self.client.login(username='learner', password='secret')
+
+    def create_question(self, content):
+        """Create a question with one correct and one incorrect choice."""
+        question = Question.objects.create(course=self.course, content=content, grade=50)
+        correct = Choice.objects.create(question=question, content='Right', is_correct=True)
+        wrong = Choice.objects.create(question=question, content='Wrong', is_correct=False)
+        return question, correct, wrong
+
+    def submit(self, choice_ids):
+        """Submit the exam form and return the redirect response."""
+        return self.client.post(
+            reverse('onlinecourse:submit', args=(self.course.id,)),
+            {'choices': choice_ids}
+        )
+
+    def test_submit_and_show_result_grade(self):
+        """Only questions answered exactly right count towards the grade."""
+        (_, right_1, _), (_, right_2, wrong_2) = self.questions
+        response = self.submit([right_1.id, right_2.id, wrong_2.id])
+        submission = Submission.objects.get()
+        self.assertRedirects(
+            response,
+            reverse('onlinecourse:exam_result', args=(self.course.id, submission.id))
+        )
+        self.assertEqual(
+            set(submission.choices.values_list('id', flat=True)),
+            {right_1.id, right_2.id, wrong_2.id}
+        )
+
+        response = self.client.get(response.url)
+        self.assertEqual(response.context['grade'], 50)
+
+    def test_is_get_score_fails_with_extra_wrong_choice(self):
+        """Selecting an incorrect choice alongside the correct one loses the score."""
+        question, correct, wrong = self.questions[0]
+        self.assertTrue(question.is_get_score([correct.id]))
+        self.assertFalse(question.is_get_score([correct.id, wrong.id]))
+        self.assertFalse(question.is_get_score([]))
+
+    def test_show_result_query_count_is_constant(self):
+        """The result view does not issue queries per question."""
+        for extra_questions, expected_grade in ((0, 100), (5, 350)):
+            for i in range(extra_questions):
+                self.create_question(f'Extra question {i}')
+            choice_ids = list(
+                Choice.objects.filter(is_correct=True).values_list('id', flat=True)
+            )
+            result_url = self.submit(choice_ids).url
+
+            # Session, user, course, questions, choices, submission, selected choices
+            with self.assertNumQueries(7):
+                response = self.client.get(result_url)
+            self.assertEqual(response.context['grade'], expected_grade)
 
-# Create your tests here.
+    def test_submit_requires_login(self):
+        """Anonymous submissions are redirected to the login page."""
+        self.client.logout()
+        response = self.submit([self.questions[0][1].id])
+        self.assertRedirects(response, reverse('onlinecourse:login'))
+        self.assertFalse(Submission.objects.exists())
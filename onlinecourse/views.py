@@ -9,12 +9,17 @@ import logging
 
 from django.contrib.auth import login, logout, authenticate
 from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.db.models import F
 from django.http import HttpResponseRedirect
 from django.shortcuts import render, get_object_or_404, redirect
 from django.urls import reverse
 from django.views import generic
 
-from .models import Course, Enrollment, Submission
+from .models import (
+    TOP_COURSES_CACHE_KEY, TOP_COURSES_CACHE_TIMEOUT,
+    Course, Enrollment, Submission, SubmissionChoice
+)
 
 # Get an instance of a logger
 logger = logging.getLogger(__name__)
@@ -32,14 +37,10 @@ def registration_request(request):
         password = request.POST['psw']
         first_name = request.POST['firstname']
         last_name = request.POST['lastname']
-        user_exist = False
-        try:
-            User.objects.get(username=username)
-            user_exist = True
-        except User.DoesNotExist:
-            logger.info("New user registration: %s", username)
+        user_exist = User.objects.filter(username=username).exists()
 
         if not user_exist:
+            logger.info("New user registration: %s", username)
             user = User.objects.create_user(
                 username=username,
                 first_name=first_name,
@@ -83,19 +84,21 @@ def check_if_enrolled(user, course):
     is_enrolled = False
     if user.id is not None:
         # Check if user enrolled
-        num_results = Enrollment.objects.filter(user=user, course=course).count()
-        if num_results > 0:
-            is_enrolled = True
+        is_enrolled = Enrollment.objects.filter(user=user, course=course).exists()
     return is_enrolled
 
 def submit(request, course_id):
     """Create an exam submission record for a course enrollment."""
-    course = get_object_or_404(Course, pk=course_id)
-    user = request.user
-    enrollment = Enrollment.objects.get(user=user, course=course)
+    if not request.user.is_authenticated:
+        return redirect('onlinecourse:login')
+    enrollment = get_object_or_404(Enrollment, user=request.user, course_id=course_id)
     submission = Submission.objects.create(enrollment=enrollment)
     choices = extract_answers(request)
-    submission.choices.set(choices)
+    # Insert all selected choices in one batched statement
+    SubmissionChoice.objects.bulk_create(
+        [SubmissionChoice(submission=submission, choice_id=choice_id) for choice_id in choices],
+        ignore_conflicts=True
+    )
     submission_id = submission.id
     return HttpResponseRedirect(
         reverse(viewname='onlinecourse:exam_result', args=(course_id, submission_id,))
@@ -103,38 +106,40 @@ def submit(request, course_id):
 
 def extract_answers(request):
     """Collect the selected choices from the exam form from the request object."""
-    submitted_answers = []
-    for key in request.POST:
-        if key.startswith('choice'):
-            value = request.POST[key]
-            choice_id = int(value)
-            submitted_answers.append(choice_id)
-    return submitted_answers
+    return list(map(int, request.POST.getlist('choices')))
 
 def show_exam_result(request, course_id, submission_id):
     """Show exam result to student after submission."""
     context = {}
-    course = get_object_or_404(Course, pk=course_id)
-    submission = Submission.objects.get(id=submission_id)
-    choices = submission.choices.all()
+    # Prefetch the whole grading tree so the loop and template need no further queries
+    course = get_object_or_404(
+        Course.objects.prefetch_related('question_set__choice_set'),
+        pk=course_id
+    )
+    submission = get_object_or_404(
+        Submission.objects.prefetch_related('choices'),
+        id=submission_id
+    )
+    selected_ids = set()
+    selected_by_question = {}
+    for choice in submission.choices.all():
+        selected_ids.add(choice.id)
+        selected_by_question.setdefault(choice.question_id, set()).add(choice.id)
 
     total_score = 0
-    questions = course.question_set.all()
-
-    for question in questions:
-        # Get all correct choices for the question
-        correct_choices = question.choice_set.filter(is_correct=True)
+    for question in course.question_set.all():
+        correct_ids = {choice.id for choice in question.choice_set.all() if choice.is_correct}
         # Get the user's selected choices for the question
-        selected_choices = choices.filter(question=question)
+        question_selected_ids = selected_by_question.get(question.id, set())
 
         # Check if the selected choices are the same as the correct choices
-        if set(correct_choices) == set(selected_choices):
+        if correct_ids == question_selected_ids:
             # Add the question's grade only if all correct answers are selected
             total_score += question.grade
 
     context['course'] = course
     context['grade'] = total_score
-    context['choices'] = choices
+    context['selected_ids'] = selected_ids
 
     return render(request, 'onlinecourse/exam_result_bootstrap.html', context)
 
@@ -147,10 +152,24 @@ class CourseListView(generic.ListView):
     def get_queryset(self):
         """Get the list of courses with enrollment status."""
         user = self.request.user
-        courses = Course.objects.order_by('-total_enrollment')[:10]
+        courses = cache.get_or_set(
+            TOP_COURSES_CACHE_KEY,
+            lambda: list(
+                Course.objects.only('id', 'name', 'image', 'description', 'total_enrollment')
+                .order_by('-total_enrollment')[:10]
+            ),
+            TOP_COURSES_CACHE_TIMEOUT
+        )
+        if not user.is_authenticated:
+            return courses
+
+        # Look up the user's enrollments for every listed course at once
+        enrolled_ids = set(
+            Enrollment.objects.filter(user=user, course__in=courses)
+            .values_list('course_id', flat=True)
+        )
         for course in courses:
-            if user.is_authenticated:
-                course.is_enrolled = check_if_enrolled(user, course)
+            course.is_enrolled = course.id in enrolled_ids
         return courses
 
 
@@ -169,8 +188,9 @@ def enroll(request, course_id):
     if not is_enrolled and user.is_authenticated:
         # Create an enrollment
         Enrollment.objects.create(user=user, course=course, mode='honor')
-        course.total_enrollment += 1
-        course.save()
+        # Increment in the database to avoid lost updates from concurrent enrollments
+        Course.objects.filter(pk=course.pk).update(total_enrollment=F('total_enrollment') + 1)
+        cache.delete(TOP_COURSES_CACHE_KEY)
 
     return HttpResponseRedirect(
         reverse(viewname='onlinecourse:course_details', args=(course.id,))